@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, ServiceCall
-from homeassistant.const import Platform
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP, Platform
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers import device_registry as dr
@@ -10,7 +10,10 @@ from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.event import async_track_time_change
 from homeassistant.util import dt as dt_util
 
+import base64
 import logging
+import os
+import re
 
 from .const import DOMAIN, SIGNAL_CHILDREN_UPDATED, SIGNAL_DATA_UPDATED
 from .storage import KidsChoresStore
@@ -212,7 +215,6 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     # Upload images for shop items into /config/www/chores4kids
     async def svc_upload_shop_image(call: ServiceCall):
-        import os, base64, re
         rel_dir = hass.config.path('www', 'chores4kids')
         os.makedirs(rel_dir, exist_ok=True)
         filename = call.data.get('filename') or 'upload.bin'
@@ -239,7 +241,6 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
         Safety: only allows deleting a single filename (no paths) after sanitization.
         """
-        import os, re
         rel_dir = hass.config.path('www', 'chores4kids')
         os.makedirs(rel_dir, exist_ok=True)
         filename = call.data.get('filename') or ''
@@ -275,7 +276,6 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         - completion.mp3 / completion.wav / completion.ogg / completion.m4a / completion.aac
         - completion_<timestamp>.<ext>
         """
-        import os, re
         rel_dir = hass.config.path('www', 'chores4kids')
         os.makedirs(rel_dir, exist_ok=True)
         pattern = re.compile(r'^completion(_\d+)?\.(mp3|wav|ogg|m4a|aac)$', re.IGNORECASE)
@@ -321,7 +321,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                 break
         if task:
             task.carried_over = True
-            await store.async_save()
+            store.mark_dirty("tasks")
             async_dispatcher_send(hass, SIGNAL_DATA_UPDATED)
 
     hass.services.async_register(DOMAIN, 'debug_mark_overdue', svc_debug_mark_overdue)
@@ -411,11 +411,20 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     async_track_time_change(hass, _midnight_cb, hour=0, minute=0, second=0)
     hass.async_create_task(store.daily_rollover())
 
+    # Writes are debounced; make sure pending changes hit disk on shutdown.
+    async def _flush_on_stop(_event):
+        await store.async_flush()
+
+    entry.async_on_unload(hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _flush_on_stop))
+
     return True
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
+        store: KidsChoresStore | None = hass.data.get(DOMAIN, {}).get("store")
+        if store is not None:
+            await store.async_flush()
         hass.data.pop(DOMAIN, None)
     return unload_ok
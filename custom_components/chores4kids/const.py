@@ -2,5 +2,9 @@ DOMAIN = "chores4kids"
 PLATFORMS = ["sensor"]
 STORAGE_KEY = DOMAIN
 STORAGE_VERSION = 1
+# Seconds to debounce store writes (pending writes are flushed on stop/unload)
+SAVE_DELAY = 10
+# Seconds to wait before unlinking images of deleted shop items (batches deletes)
+IMAGE_SWEEP_DELAY = 30
 SIGNAL_CHILDREN_UPDATED = f"{DOMAIN}_children_updated"
 SIGNAL_DATA_UPDATED = f"{DOMAIN}_data_updated"
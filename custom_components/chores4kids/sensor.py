@@ -144,7 +144,7 @@ class KidsChoresPointsSensor(SensorEntity):
     @property
     def extra_state_attributes(self):
         ch = self._child
-        tasks = [t for t in self._store.tasks if t.assigned_to == ch.id]
+        tasks = self._store.tasks_for_child(ch.id)
         counts = {
             "assigned_count": sum(1 for t in tasks if t.status == "assigned"),
             "in_progress_count": sum(1 for t in tasks if t.status == "in_progress"),
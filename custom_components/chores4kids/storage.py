@@ -1,16 +1,25 @@
 from __future__ import annotations
-from dataclasses import dataclass, asdict, field
-from typing import Any, Dict, List, Optional
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, List, NamedTuple, Optional, Union
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.storage import Store
 from homeassistant.util import dt as dt_util
 from uuid import uuid4
 import os
+import sys
 import asyncio
+import logging
+from collections import Counter
 import unicodedata
 import re
 
-from .const import STORAGE_KEY, STORAGE_VERSION
+from .const import IMAGE_SWEEP_DELAY, SAVE_DELAY, STORAGE_KEY, STORAGE_VERSION
+
+_LOGGER = logging.getLogger(__name__)
 
 STATUS_ASSIGNED = "assigned"
 STATUS_IN_PROGRESS = "in_progress"
@@ -18,29 +27,55 @@ STATUS_AWAITING = "awaiting_approval"
 STATUS_APPROVED = "approved"
 STATUS_REJECTED = "rejected"
 
-STATUSES = {STATUS_ASSIGNED, STATUS_IN_PROGRESS, STATUS_AWAITING, STATUS_APPROVED, STATUS_REJECTED}
+STATUSES = frozenset({STATUS_ASSIGNED, STATUS_IN_PROGRESS, STATUS_AWAITING, STATUS_APPROVED, STATUS_REJECTED})
+# Statuses of a repeat instance that is still open (blocks spawning another one)
+_OPEN_STATUSES = frozenset({STATUS_ASSIGNED, STATUS_IN_PROGRESS, STATUS_AWAITING})
+# Statuses of a repeat instance that still follows edits to its template
+_SYNCED_STATUSES = _OPEN_STATUSES | {STATUS_REJECTED}
+
+_HEX = frozenset("0123456789abcdef")
+# Shop action step types that map to a Home Assistant service call
+_SERVICE_TYPES = frozenset({"entity_service", "service", "call_service"})
+
+
+_SLUG_RE = re.compile(r"[^a-zA-Z0-9]+")
+_UTC = timezone.utc
+# Record collections persisted by the store, in payload order
+_SAVE_PARTS = ("children", "tasks", "categories", "items", "purchases")
 
 
 def slugify(value: str) -> str:
-    value = unicodedata.normalize("NFKD", value).encode("ascii", "ignore").decode("ascii")
-    value = re.sub(r"[^a-zA-Z0-9]+", "_", value).strip("_")
+    """Slug for a child name; ASCII names skip the NFKD round-trip.
+
+    Kept on NFKD + ascii-ignore rather than a hand-made transliteration table so
+    existing slugs (and the entity ids built from them) never change.
+    """
+    if not value.isascii():
+        value = unicodedata.normalize("NFKD", value).encode("ascii", "ignore").decode("ascii")
+    value = _SLUG_RE.sub("_", value).strip("_")
     return value.lower() or "child"
 
-@dataclass
+@dataclass(slots=True)
 class Child:
     id: str
     name: str
     points: int = 0
     slug: str = ""
 
-@dataclass
+    def to_dict(self) -> Dict[str, Any]:
+        return {"id": self.id, "name": self.name, "points": self.points, "slug": self.slug}
+
+@dataclass(slots=True)
 class Category:
     id: str
     name: str
     # Optional hex color (e.g. "#ff0000") used for UI chips. Empty means "no custom color".
     color: str = ""
 
-@dataclass
+    def to_dict(self) -> Dict[str, Any]:
+        return {"id": self.id, "name": self.name, "color": self.color}
+
+@dataclass(slots=True)
 class Task:
     id: str
     title: str
@@ -98,15 +133,214 @@ class Task:
     # For non-winning siblings, this represents when the task was "lost/taken".
     fastest_wins_claimed_ts: Optional[int] = None
 
+    # Local date parsed from `created`, keyed by the string it came from (not persisted)
+    _created_cache: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+
+    def to_dict(self) -> Dict[str, Any]:
+        # List fields are copied: the payload is encoded in the executor and must not
+        # share a list with the live task.
+        return {
+            "id": self.id,
+            "title": self.title,
+            "points": self.points,
+            "assigned_to": self.assigned_to,
+            "status": self.status,
+            "description": self.description,
+            "created": self.created,
+            "due": self.due,
+            "approved_at": self.approved_at,
+            "icon": self.icon,
+            "repeat_days": list(self.repeat_days),
+            "schedule_mode": self.schedule_mode,
+            "repeat_template_id": self.repeat_template_id,
+            "repeat_child_id": self.repeat_child_id,
+            "repeat_child_ids": list(self.repeat_child_ids),
+            "persist_until_completed": self.persist_until_completed,
+            "quick_complete": self.quick_complete,
+            "skip_approval": self.skip_approval,
+            "categories": list(self.categories),
+            "carried_over": self.carried_over,
+            "completed_ts": self.completed_ts,
+            "early_bonus_enabled": self.early_bonus_enabled,
+            "early_bonus_days": self.early_bonus_days,
+            "early_bonus_points": self.early_bonus_points,
+            "fastest_wins": self.fastest_wins,
+            "fastest_wins_template_id": self.fastest_wins_template_id,
+            "fastest_wins_claimed_by_child_id": self.fastest_wins_claimed_by_child_id,
+            "fastest_wins_claimed_by_child_name": self.fastest_wins_claimed_by_child_name,
+            "fastest_wins_claimed_ts": self.fastest_wins_claimed_ts,
+        }
+
+
+_DAY_KEY = MappingProxyType({"mon": 0, "tue": 1, "wed": 2, "thu": 3, "fri": 4, "sat": 5, "sun": 6})
+_WEEKDAY_RANGE = range(7)
+
+
+def _norm_days(days) -> list[int]:
+    """Normalize repeat days (0=Mon .. 6=Sun, or names like "mon") to a sorted unique list."""
+    if not days:
+        return []
+    out: set[int] = set()
+    for d in days:
+        if isinstance(d, int):
+            if d in _WEEKDAY_RANGE:
+                out.add(int(d))
+        else:
+            v = _DAY_KEY.get(str(d).strip().lower()[:3])
+            if v is not None:
+                out.add(v)
+    return sorted(out)
+
+
+def _remove_identity(items: list, obj) -> None:
+    """Remove ``obj`` from ``items`` by identity.
+
+    list.remove() would run the dataclass field-by-field __eq__ against every
+    element before the match.
+    """
+    for i, x in enumerate(items):
+        if x is obj:
+            del items[i]
+            return
+
+
+def _now_iso() -> str:
+    """Current UTC time as an ISO string (the format used for created/approved stamps)."""
+    return datetime.now(_UTC).isoformat()
+
+
+def _first_str(d: Dict[str, Any], *keys: str) -> str:
+    """Return the first truthy value among ``keys`` in ``d`` as a stripped string."""
+    for k in keys:
+        v = d.get(k)
+        if v:
+            return str(v).strip()
+    return ""
+
+
+def _stamp_created(t: Task) -> None:
+    """Set ``t.created`` to now, seeding the parsed-date cache so it is never parsed."""
+    now = dt_util.utcnow()
+    t.created = now.isoformat()
+    t._created_cache = (t.created, dt_util.as_local(now).date())
+
+
+def _task_local_date(t: Task) -> Optional[date]:
+    """Local calendar date of ``t.created`` (None if missing/invalid), parsed once per value."""
+    raw = t.created
+    cache = t._created_cache
+    if cache is not None and cache[0] == raw:
+        return cache[1]
+    day = None
+    if raw:
+        try:
+            created_dt = dt_util.parse_datetime(str(raw))
+            if created_dt is None:
+                created_dt = datetime.fromisoformat(str(raw))
+            day = dt_util.as_local(created_dt).date()
+        except Exception:
+            day = None
+    t._created_cache = (raw, day)
+    return day
+
+
+def _early_bonus_points(t: Task) -> int:
+    """Return the early-completion bonus earned by ``t`` (0 when not applicable)."""
+    try:
+        # Coerced like the other early-bonus readers: older storage and service
+        # calls may hold strings or None here.
+        eb_days = int(t.early_bonus_days or 0)
+        eb_points = int(t.early_bonus_points or 0)
+        if not t.early_bonus_enabled or eb_days <= 0 or eb_points <= 0 or not t.due or not t.completed_ts:
+            return 0
+        # Parse due as datetime or date (YYYY-MM-DD)
+        due_dt = dt_util.parse_datetime(str(t.due))
+        if due_dt is not None:
+            due_date = dt_util.as_local(due_dt).date()
+        else:
+            due_date = dt_util.parse_date(str(t.due))
+            if due_date is None:
+                return 0
+        comp_dt = datetime.fromtimestamp(int(t.completed_ts) / 1000.0, _UTC)
+        if dt_util.as_local(comp_dt).date() <= due_date - timedelta(days=eb_days):
+            return eb_points
+    except Exception:
+        pass
+    return 0
+
+
+def _days_mask(days) -> int:
+    """Pack weekday numbers (0=Mon .. 6=Sun) into a 7-bit mask."""
+    mask = 0
+    for d in days:
+        d = int(d)
+        if 0 <= d <= 6:
+            mask |= 1 << d
+    return mask
+
+
+@lru_cache(maxsize=4096)
+def _next_repeat_due_cached(base_iso: str, rdays_mask: int, include_today: bool) -> Optional[str]:
+    """Return the ISO date of the next weekday in ``rdays_mask`` on/after ``base_iso``."""
+    if not rdays_mask:
+        return None
+    base = date.fromisoformat(base_iso)
+    wd = base.weekday()
+    start = 0 if include_today else 1
+    for delta in range(start, start + 7):
+        if rdays_mask >> ((wd + delta) % 7) & 1:
+            return (base + timedelta(days=delta)).isoformat()
+    return None
+
 class KidsChoresStore:
+    # Max concurrent service calls while running a shop item's actions
+    _ACTION_FANOUT = 16
+
     def __init__(self, hass: HomeAssistant):
         self.hass = hass
-        self._store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        # _async_write hands Store a payload snapshot built on the loop; with
+        # serialize_in_event_loop=False Store encodes and writes it in the executor.
+        # Atomic writes keep a crash mid-write from truncating the file.
+        self._store = Store(
+            hass, STORAGE_VERSION, STORAGE_KEY,
+            atomic_writes=True, serialize_in_event_loop=False,
+        )
         self.children: List[Child] = []
         self.tasks: List[Task] = []
         self.categories: List[Category] = []
         self.items: List["ShopItem"] = []
         self.purchases: List["Purchase"] = []
+        # id -> record indexes, kept in sync with the lists above
+        self._children_by_id: Dict[str, Child] = {}
+        self._tasks_by_id: Dict[str, Task] = {}
+        # Unassigned (template) tasks by id, for O(1) template lookups on hot paths
+        self._templates_by_id: Dict[str, Task] = {}
+        # Reverse index category id -> {task id: task} for tasks tagged with it
+        self._tasks_by_category: Dict[str, Dict[str, Task]] = {}
+        # Child id -> {task id: task} for tasks assigned to that child
+        self._tasks_by_child: Dict[str, Dict[str, Task]] = {}
+        # Repeat template id -> {task id: task} for instances spawned from it
+        # (repeat_template_id is fixed at creation, so only add/remove maintain it)
+        self._instances_by_template: Dict[str, Dict[str, Task]] = {}
+        self._categories_by_id: Dict[str, Category] = {}
+        self._items_by_id: Dict[str, "ShopItem"] = {}
+        # Compiled action steps per shop item id (derived from ShopItem.actions, not persisted)
+        self._compiled_actions: Dict[str, List[Union["DelayStep", "ServiceStep"]]] = {}
+        # Set by _mark_dirty(), cleared when a write starts and set again if it fails
+        self._dirty: bool = False
+        self._save_unsub = None
+        self._flush_lock = asyncio.Lock()
+        # Serialized record lists per collection, rebuilt only for collections
+        # marked dirty since the last write
+        self._payload_parts: Dict[str, List[Dict[str, Any]]] = {}
+        self._dirty_parts: set[str] = set(_SAVE_PARTS)
+        self._action_sem: Optional[asyncio.Semaphore] = None
+        # /local/ image URLs of deleted shop items, checked and unlinked together
+        # by a delayed sweep (see _async_sweep_orphan_images)
+        self._orphan_images: set[str] = set()
+        # Image URL -> number of shop items/purchases referencing it
+        self._image_refs: Counter[str] = Counter()
+        self._orphan_sweep_unsub = None
         # Global UI settings (shared across users/devices via HA storage)
         self.ui_colors: Dict[str, str] = {}
         self.enable_points: bool = True
@@ -116,26 +350,20 @@ class KidsChoresStore:
         data = await self._store.async_load()
         if not data:
             return
-        self.children = [Child(**c) for c in data.get("children", [])]
-        self.categories = [Category(**c) for c in data.get("categories", [])]
-        # Migrate tasks: if early bonus was configured before the explicit toggle existed,
-        # enable it automatically so behavior remains unchanged.
-        raw_tasks = list(data.get("tasks", []) or [])
-        migrated: list[Task] = []
-        for t in raw_tasks:
-            try:
-                if isinstance(t, dict) and "early_bonus_enabled" not in t:
-                    eb_days = int(t.get("early_bonus_days", 0) or 0)
-                    eb_points = int(t.get("early_bonus_points", 0) or 0)
-                    t["early_bonus_enabled"] = bool(eb_days > 0 and eb_points > 0)
-            except Exception:
-                # Best-effort migration; fall back to dataclass defaults
-                pass
-            migrated.append(Task(**t))
-        self.tasks = migrated
-        # Optional keys for backwards compatibility
-        self.items = [ShopItem(**i) for i in data.get("items", [])]
-        self.purchases = [Purchase(**p) for p in data.get("purchases", [])]
+        # Rebuilding the records is pure CPU work that grows with the purchase/task
+        # history, so it runs in the executor; only the assignments happen on the loop.
+        (
+            self.children,
+            self.categories,
+            self.tasks,
+            self.items,
+            self.purchases,
+        ) = await self.hass.async_add_executor_job(_records_from_data, data)
+        self._children_by_id = {c.id: c for c in self.children}
+        self._categories_by_id = {c.id: c for c in self.categories}
+        self._rebuild_task_indexes()
+        self._items_by_id = {i.id: i for i in self.items}
+        self._rebuild_image_refs()
         try:
             raw_colors = data.get("ui_colors") or {}
             self.ui_colors = {str(k): str(v) for k, v in raw_colors.items() if v is not None}
@@ -152,18 +380,91 @@ class KidsChoresStore:
         except Exception:
             self.confetti_enabled = True
 
-    async def async_save(self):
-        await self._store.async_save({
+    def mark_dirty(self, *parts: str) -> None:
+        """Flag records edited outside the store; they are written with the next debounced save."""
+        self._mark_dirty(*parts)
+
+    def _mark_dirty(self, *parts: str) -> None:
+        """Record a mutation and arm the single debounced write.
+
+        Bursts of mutations collapse into one write, SAVE_DELAY after the first of
+        them. parts names the record collections that changed (see _SAVE_PARTS);
+        without arguments every collection is re-serialized on the next write.
+        """
+        self._dirty = True
+        self._dirty_parts.update(parts or _SAVE_PARTS)
+        self._schedule_write()
+
+    def _mark_settings_dirty(self) -> None:
+        """Schedule a write for a UI settings change without re-serializing any records.
+
+        ui_colors/enable_points/confetti_enabled are rebuilt by every _snapshot().
+        """
+        self._dirty = True
+        self._schedule_write()
+
+    def _schedule_write(self) -> None:
+        if self._save_unsub is None:
+            self._save_unsub = async_call_later(
+                self.hass, SAVE_DELAY, self._async_delayed_write
+            )
+
+    async def _async_delayed_write(self, _now=None) -> None:
+        self._save_unsub = None
+        async with self._flush_lock:
+            await self._async_write()
+
+    async def async_flush(self):
+        """Write pending changes immediately (unload/shutdown); no-op when clean.
+
+        Serialized by a lock: overlapping callers (stop event and unload) wait for
+        the write in progress instead of returning before it has landed, and
+        find the store clean afterwards instead of writing it again.
+        """
+        async with self._flush_lock:
+            if self._save_unsub is not None:
+                self._save_unsub()
+                self._save_unsub = None
+            if self._orphan_sweep_unsub is not None:
+                self._orphan_sweep_unsub()
+                await self._async_sweep_orphan_images()
+            await self._async_write()
+
+    async def _async_write(self) -> None:
+        """Snapshot the payload on the loop and let Store encode and write it off-loop."""
+        if not self._dirty:
+            return
+        self._dirty = False
+        try:
+            await self._store.async_save(self._snapshot())
+        except OSError as err:
+            # Store logs (and swallows) encode/write errors itself; what it lets
+            # through, e.g. failing to create the storage directory, keeps the
+            # write pending. The cached payload parts are current, so only the
+            # pending write is restored; the next debounced write (or flush) retries it.
+            _LOGGER.error("Error writing %s: %s", STORAGE_KEY, err)
+            self._dirty = True
+            self._schedule_write()
+
+    def _snapshot(self) -> Dict[str, Any]:
+        """Build the storage payload on the loop for Store to encode in the executor.
+
+        Only collections marked dirty are re-serialized; the cached record lists
+        are copied, so nothing the executor encodes is shared with live state
+        (_append_purchase extends the cached purchases list in place).
+        """
+        cached = self._payload_parts
+        for part in self._dirty_parts:
+            if part in _SAVE_PARTS:
+                cached[part] = [r.to_dict() for r in getattr(self, part)]
+        self._dirty_parts.clear()
+        return {
             "version": STORAGE_VERSION,
-            "children": [asdict(c) for c in self.children],
-            "tasks": [asdict(t) for t in self.tasks],
-            "categories": [asdict(c) for c in self.categories],
-            "items": [asdict(i) for i in self.items],
-            "purchases": [asdict(p) for p in self.purchases],
+            **{part: list(cached[part]) for part in _SAVE_PARTS},
             "ui_colors": dict(self.ui_colors or {}),
             "enable_points": bool(getattr(self, "enable_points", True)),
             "confetti_enabled": bool(getattr(self, "confetti_enabled", True)),
-        })
+        }
 
     async def set_ui_colors(
         self,
@@ -215,7 +516,7 @@ class KidsChoresStore:
 
         if confetti_enabled is not None:
             self.confetti_enabled = bool(confetti_enabled)
-        await self.async_save()
+        self._mark_settings_dirty()
         return dict(self.ui_colors)
 
     # --- Children ---
@@ -223,25 +524,28 @@ class KidsChoresStore:
         cid = str(uuid4())
         ch = Child(id=cid, name=name.strip(), points=0, slug=slugify(name))
         self.children.append(ch)
-        await self.async_save()
+        self._children_by_id[cid] = ch
+        self._mark_dirty("children")
         return ch
 
     async def rename_child(self, child_id: str, new_name: str):
-        for c in self.children:
-            if c.id == child_id:
-                c.name = new_name.strip()
-                c.slug = slugify(c.name)
-                await self.async_save()
-                return c
-        raise ValueError("child_not_found")
+        c = self._get_child(child_id)
+        name = new_name.strip()
+        if c.name != name:
+            c.name = name
+            c.slug = slugify(name)
+            self._mark_dirty("children")
+        return c
 
     async def remove_child(self, child_id: str):
-        self.children = [c for c in self.children if c.id != child_id]
+        ch = self._children_by_id.pop(child_id, None)
+        if ch is not None:
+            _remove_identity(self.children, ch)
         # Orphan tasks: keep but unassign
-        for t in self.tasks:
-            if t.assigned_to == child_id:
-                t.assigned_to = None
-        await self.async_save()
+        for t in self._tasks_by_child.pop(child_id, {}).values():
+            t.assigned_to = None
+            self._templates_by_id[t.id] = t
+        self._mark_dirty("children", "tasks")
 
     # --- Tasks ---
     async def add_task(
@@ -267,21 +571,57 @@ class KidsChoresStore:
         fastest_wins_template_id: Optional[str] = None,
         schedule_mode: Optional[str] = None,
     ) -> Task:
-        tid = str(uuid4())
-        # normalize repeat days to list[int]
-        def _norm_days(days):
-            if not days:
-                return []
-            key = {"mon":0,"tue":1,"wed":2,"thu":3,"fri":4,"sat":5,"sun":6}
-            out = []
-            for d in days:
-                if isinstance(d, int):
-                    if 0 <= d <= 6: out.append(int(d))
-                else:
-                    dd = str(d).strip().lower()[:3]
-                    if dd in key: out.append(key[dd])
-            return sorted(set(out))
+        """Create a task and schedule a write."""
+        t = self._make_task(
+            title,
+            points,
+            description=description,
+            due=due,
+            assigned_to=assigned_to,
+            repeat_days=repeat_days,
+            repeat_child_id=repeat_child_id,
+            repeat_child_ids=repeat_child_ids,
+            repeat_template_id=repeat_template_id,
+            icon=icon,
+            persist_until_completed=persist_until_completed,
+            quick_complete=quick_complete,
+            skip_approval=skip_approval,
+            categories=categories,
+            early_bonus_enabled=early_bonus_enabled,
+            early_bonus_days=early_bonus_days,
+            early_bonus_points=early_bonus_points,
+            fastest_wins=fastest_wins,
+            fastest_wins_template_id=fastest_wins_template_id,
+            schedule_mode=schedule_mode,
+        )
+        self._mark_dirty("tasks")
+        return t
 
+    def _make_task(
+        self,
+        title: str,
+        points: int,
+        description: str = "",
+        due: Optional[str] = None,
+        assigned_to: Optional[str] = None,
+        repeat_days: Optional[list[int] | list[str]] = None,
+        repeat_child_id: Optional[str] = None,
+        repeat_child_ids: Optional[list[str]] = None,
+        repeat_template_id: Optional[str] = None,
+        icon: Optional[str] = None,
+        persist_until_completed: Optional[bool] = None,
+        quick_complete: Optional[bool] = None,
+        skip_approval: Optional[bool] = None,
+        categories: Optional[list[str]] = None,
+        early_bonus_enabled: Optional[bool] = None,
+        early_bonus_days: Optional[int] = None,
+        early_bonus_points: Optional[int] = None,
+        fastest_wins: Optional[bool] = None,
+        fastest_wins_template_id: Optional[str] = None,
+        schedule_mode: Optional[str] = None,
+    ) -> Task:
+        """Build, validate and index a new task without scheduling a write."""
+        tid = str(uuid4())
         t = Task(
             id=tid,
             title=title.strip(),
@@ -291,8 +631,7 @@ class KidsChoresStore:
             icon=(icon or "").strip(),
             repeat_template_id=(repeat_template_id or None),
         )
-        from datetime import datetime, timezone
-        t.created = datetime.now(timezone.utc).isoformat()
+        _stamp_created(t)
 
         if early_bonus_enabled is not None:
             t.early_bonus_enabled = bool(early_bonus_enabled)
@@ -345,29 +684,15 @@ class KidsChoresStore:
             t.repeat_days = []
         else:
             t.repeat_days = _norm_days(repeat_days)
-        # Support multiple repeat children (and legacy single field)
-        ids: list[str] = []
-        try:
-            if repeat_child_ids:
-                for cid in repeat_child_ids:
-                    if not cid:
-                        continue
-                    self._get_child(cid)
-                    if cid not in ids:
-                        ids.append(cid)
-        except Exception:
-            # if any invalid id, ignore it (but keep others)
-            pass
-        if repeat_child_id:
+        # Support multiple repeat children (and legacy single field).
+        # Ordered de-dupe; unknown ids are ignored but the others kept.
+        children = self._children_by_id
+        ids = dict.fromkeys(cid for cid in (repeat_child_ids or ()) if cid in children)
+        if repeat_child_id in children:
             # keep legacy field but also mirror into list if absent
-            try:
-                self._get_child(repeat_child_id)
-                t.repeat_child_id = repeat_child_id
-                if repeat_child_id not in ids:
-                    ids.append(repeat_child_id)
-            except Exception:
-                pass
-        t.repeat_child_ids = ids
+            t.repeat_child_id = repeat_child_id
+            ids[repeat_child_id] = None
+        t.repeat_child_ids = list(ids)
 
         # Enforce mutual exclusion: weekly/monthly templates cannot carry unfinished.
         try:
@@ -376,27 +701,22 @@ class KidsChoresStore:
             is_template = False
         if is_template and t.schedule_mode in ("weekly", "monthly"):
             t.persist_until_completed = False
-        # categories (validate against known list, ignore unknown)
+        # categories (validate against known list, ignore unknown; keep order, drop dupes)
         try:
-            cat_ids: list[str] = []
-            for cid in (categories or []):
-                if any(c.id == cid for c in self.categories):
-                    if cid not in cat_ids:
-                        cat_ids.append(cid)
-            t.categories = cat_ids
+            valid = self._categories_by_id
+            t.categories = [cid for cid in dict.fromkeys(categories or []) if cid in valid]
         except Exception:
             t.categories = []
 
-        self.tasks.append(t)
+        self._append_task(t)
 
         # If this is an unassigned repeat template with early-bonus enabled, create upcoming
         # assigned instance(s) immediately, using repeat_days as the deadline.
         try:
-            await self._maybe_spawn_repeat_bonus_instances(t)
+            self._maybe_spawn_repeat_bonus_instances(t)
         except Exception:
             pass
 
-        await self.async_save()
         return t
 
     def _repeat_bonus_active(self, t: Task) -> bool:
@@ -406,54 +726,30 @@ class KidsChoresStore:
             return False
 
     def _repeat_targets_for_template(self, t: Task) -> list[str]:
-        targets: list[str] = []
-        try:
-            for cid in (getattr(t, "repeat_child_ids", []) or []):
-                if cid and cid not in targets:
-                    targets.append(cid)
-        except Exception:
-            pass
         try:
-            cid = getattr(t, "repeat_child_id", None)
-            if cid and cid not in targets:
-                targets.append(cid)
+            targets = dict.fromkeys(cid for cid in (t.repeat_child_ids or ()) if cid)
+            if t.repeat_child_id:
+                targets[t.repeat_child_id] = None
         except Exception:
-            pass
-        return targets
+            return []
+        return list(targets)
 
     def _active_repeat_instance_exists(self, template_id: str, child_id: str) -> bool:
-        for x in self.tasks:
+        for x in self._instances_by_template.get(template_id, {}).values():
             if x.assigned_to != child_id:
                 continue
-            if getattr(x, "repeat_template_id", None) != template_id:
-                continue
-            if x.status in (STATUS_ASSIGNED, STATUS_IN_PROGRESS, STATUS_AWAITING):
+            if x.status in _OPEN_STATUSES:
                 return True
         return False
 
     def _next_repeat_due_iso(self, base_date, repeat_days: list[int], include_today: bool = True) -> Optional[str]:
         try:
-            from datetime import timedelta
-            if not repeat_days:
-                return None
-            wd = int(base_date.weekday())
-            best = None
-            for d in sorted(set(int(x) for x in repeat_days if 0 <= int(x) <= 6)):
-                delta = (d - wd) % 7
-                if not include_today and delta == 0:
-                    delta = 7
-                if best is None or delta < best:
-                    best = delta
-            if best is None:
-                return None
-            return (base_date + timedelta(days=int(best))).isoformat()
+            return _next_repeat_due_cached(base_date.isoformat(), _days_mask(repeat_days or ()), bool(include_today))
         except Exception:
             return None
 
     def _next_monthly_due_iso(self, base_date, include_today: bool = True) -> Optional[str]:
         try:
-            from datetime import date, timedelta
-
             if not isinstance(base_date, date):
                 return None
 
@@ -473,7 +769,7 @@ class KidsChoresStore:
         except Exception:
             return None
 
-    async def _maybe_spawn_repeat_bonus_instances(self, template: Task):
+    def _maybe_spawn_repeat_bonus_instances(self, template: Task):
         """For repeat templates with early-bonus enabled, ensure each target child has one upcoming instance.
 
         Deadline is derived from template.repeat_days (next occurrence), not from template.due.
@@ -497,8 +793,6 @@ class KidsChoresStore:
         if not targets:
             return
 
-        from homeassistant.util import dt as dt_util
-        from datetime import datetime, timezone
         today = dt_util.now().date()  # local
         if mode == "monthly":
             due_iso = self._next_monthly_due_iso(today, include_today=True)
@@ -526,7 +820,6 @@ class KidsChoresStore:
                 assigned_to=cid,
                 status=STATUS_ASSIGNED,
                 description=getattr(template, "description", "") or "",
-                created=datetime.now(timezone.utc).isoformat(),
                 due=due_iso,
                 icon=getattr(template, "icon", "") or "",
                 repeat_template_id=template.id,
@@ -538,7 +831,8 @@ class KidsChoresStore:
             inst.early_bonus_enabled = bool(getattr(template, "early_bonus_enabled", False))
             inst.early_bonus_days = int(getattr(template, "early_bonus_days", 0) or 0)
             inst.early_bonus_points = int(getattr(template, "early_bonus_points", 0) or 0)
-            self.tasks.append(inst)
+            _stamp_created(inst)
+            self._append_task(inst)
 
     async def assign_task(self, task_id: str, child_id: str):
         t = self._get_task(task_id)
@@ -560,7 +854,7 @@ class KidsChoresStore:
                     repeat_template_id = t.id
             except Exception:
                 repeat_template_id = None
-            await self.add_task(
+            self._make_task(
                 title=t.title,
                 points=t.points,
                 description=t.description,
@@ -579,33 +873,18 @@ class KidsChoresStore:
                 fastest_wins_template_id=(t.id if bool(getattr(t, "fastest_wins", False)) else None),
                 schedule_mode=getattr(t, "schedule_mode", None),
             )
-            # add_task persists; nothing else to do
+            self._mark_dirty("tasks")
             return
         # If the task is already assigned, reassign it to the new child
-        t.assigned_to = child_id
+        self._set_task_assignee(t, child_id)
         t.status = STATUS_ASSIGNED
-        await self.async_save()
+        self._mark_dirty("tasks")
 
     async def set_task_status(self, task_id: str, status: str, completed_ts: Optional[int] = None):
         if status not in STATUSES:
             raise ValueError("invalid_status")
         t = self._get_task(task_id)
 
-        def _local_created_date(task: Task):
-            from homeassistant.util import dt as dt_util
-            from datetime import datetime
-
-            created_raw = getattr(task, "created", None)
-            if not created_raw:
-                return None
-            try:
-                dt = dt_util.parse_datetime(str(created_raw))
-                if dt is None:
-                    dt = datetime.fromisoformat(str(created_raw))
-                return dt_util.as_local(dt).date()
-            except Exception:
-                return None
-
         def _claim_fastest_wins_if_needed(task: Task, next_status: str) -> bool:
             # Claim when moving away from 'assigned' (start or one-tap completion).
             if getattr(task, "status", None) != STATUS_ASSIGNED:
@@ -614,7 +893,7 @@ class KidsChoresStore:
                 return False
             if not bool(getattr(task, "fastest_wins", False)):
                 return False
-            day = _local_created_date(task)
+            day = _task_local_date(task)
             if day is None:
                 return False
 
@@ -633,7 +912,7 @@ class KidsChoresStore:
             for other in self.tasks:
                 if other.id == task.id:
                     continue
-                if _local_created_date(other) != day:
+                if _task_local_date(other) != day:
                     continue
                 # Only consider assigned copies (templates are unassigned)
                 if not getattr(other, "assigned_to", None):
@@ -708,6 +987,7 @@ class KidsChoresStore:
                 o.fastest_wins_claimed_by_child_name = my_child_name
                 o.fastest_wins_claimed_ts = claim_ts
             return False
+        before = t.to_dict()
         # Store completion timestamp if provided
         if completed_ts is not None:
             t.completed_ts = completed_ts
@@ -716,7 +996,7 @@ class KidsChoresStore:
         # and block late claimers.
         blocked = _claim_fastest_wins_if_needed(t, status)
         if blocked:
-            await self.async_save()
+            self._mark_dirty("tasks")
             raise ValueError("task_already_claimed")
 
         # If the task is configured to skip approval, auto-approve when it would
@@ -736,12 +1016,12 @@ class KidsChoresStore:
         # If a task is sent "back" to assigned, consider it (re)assigned today
         # so it appears as a current task for the child, regardless of original day.
         if status == STATUS_ASSIGNED:
-            from datetime import datetime, timezone
-            t.created = datetime.now(timezone.utc).isoformat()
-        await self.async_save()
+            _stamp_created(t)
+        # Re-sending the current status (e.g. a double tap) changes nothing; skip the write.
+        if t.to_dict() != before:
+            self._mark_dirty("tasks")
 
     async def approve_task(self, task_id: str):
-        from datetime import datetime, timezone
         t = self._get_task(task_id)
         if not t.assigned_to:
             raise ValueError("task_not_assigned")
@@ -750,40 +1030,11 @@ class KidsChoresStore:
             # allow approving from other states but normalize
             pass
         t.status = STATUS_APPROVED
-        t.approved_at = datetime.now(timezone.utc).isoformat()
+        t.approved_at = _now_iso()
         # Clear carried_over flag when task is approved
         t.carried_over = False
         # Keep completed_ts for historical record (don't clear it)
-        bonus = 0
-        try:
-            eb_enabled = bool(getattr(t, "early_bonus_enabled", False))
-            eb_days = int(getattr(t, "early_bonus_days", 0) or 0)
-            eb_points = int(getattr(t, "early_bonus_points", 0) or 0)
-            due_raw = getattr(t, "due", None)
-            comp_ts = getattr(t, "completed_ts", None)
-
-            if eb_enabled and eb_days > 0 and eb_points > 0 and due_raw and comp_ts:
-                from datetime import timedelta
-                from homeassistant.util import dt as dt_util
-
-                # Parse due as datetime or date (YYYY-MM-DD)
-                due_dt = dt_util.parse_datetime(str(due_raw))
-                due_date = None
-                if due_dt is not None:
-                    due_date = dt_util.as_local(due_dt).date()
-                else:
-                    due_d = dt_util.parse_date(str(due_raw))
-                    if due_d is not None:
-                        due_date = due_d
-
-                if due_date is not None:
-                    completed_dt = dt_util.as_local(dt_util.utc_from_timestamp(int(comp_ts) / 1000.0))
-                    completed_date = completed_dt.date()
-                    threshold_date = due_date - timedelta(days=eb_days)
-                    if completed_date <= threshold_date:
-                        bonus = eb_points
-        except Exception:
-            bonus = 0
+        bonus = _early_bonus_points(t)
 
         child.points += int(t.points) + int(bonus)
 
@@ -792,14 +1043,8 @@ class KidsChoresStore:
         try:
             tpl_id = getattr(t, "repeat_template_id", None)
             if tpl_id and t.assigned_to:
-                template = None
-                for x in self.tasks:
-                    if x.id == tpl_id and (not x.assigned_to):
-                        template = x
-                        break
+                template = self._templates_by_id.get(tpl_id)
                 if template and getattr(template, "repeat_days", None) and self._repeat_bonus_active(template):
-                    from homeassistant.util import dt as dt_util
-                    from datetime import datetime as _dt, timezone as _tz
                     # Advance based on the instance deadline (t.due), not "today", so multi-weekday
                     # schedules chain correctly.
                     base = dt_util.now().date()
@@ -824,7 +1069,6 @@ class KidsChoresStore:
                             assigned_to=t.assigned_to,
                             status=STATUS_ASSIGNED,
                             description=getattr(template, "description", "") or "",
-                            created=_dt.now(_tz.utc).isoformat(),
                             due=next_due,
                             icon=getattr(template, "icon", "") or "",
                             repeat_template_id=template.id,
@@ -836,14 +1080,18 @@ class KidsChoresStore:
                         inst.early_bonus_enabled = bool(getattr(template, "early_bonus_enabled", False))
                         inst.early_bonus_days = int(getattr(template, "early_bonus_days", 0) or 0)
                         inst.early_bonus_points = int(getattr(template, "early_bonus_points", 0) or 0)
-                        self.tasks.append(inst)
+                        _stamp_created(inst)
+                        self._append_task(inst)
         except Exception:
             pass
-        await self.async_save()
+        self._mark_dirty("tasks", "children")
 
     async def delete_task(self, task_id: str):
-        self.tasks = [t for t in self.tasks if t.id != task_id]
-        await self.async_save()
+        t = self._tasks_by_id.get(task_id)
+        if t is not None:
+            _remove_identity(self.tasks, t)
+            self._unindex_task(t)
+        self._mark_dirty("tasks")
 
     async def set_task_repeat(
         self,
@@ -865,21 +1113,6 @@ class KidsChoresStore:
                 mode = ""
             t.schedule_mode = mode
 
-        def _norm_days(days):
-            if not days:
-                return []
-            key = {"mon": 0, "tue": 1, "wed": 2, "thu": 3, "fri": 4, "sat": 5, "sun": 6}
-            out = []
-            for d in days:
-                if isinstance(d, int):
-                    if 0 <= d <= 6:
-                        out.append(int(d))
-                else:
-                    dd = str(d).strip().lower()[:3]
-                    if dd in key:
-                        out.append(key[dd])
-            return sorted(set(out))
-
         # weekly/monthly override repeat_days
         try:
             mode = str(getattr(t, "schedule_mode", "") or "").strip().lower()
@@ -892,32 +1125,18 @@ class KidsChoresStore:
         else:
             t.repeat_days = _norm_days(repeat_days)
 
-        # normalize multi child ids
-        ids: list[str] = []
-        try:
-            for cid in (repeat_child_ids or []):
-                if not cid:
-                    continue
-                self._get_child(cid)
-                if cid not in ids:
-                    ids.append(cid)
-        except Exception:
-            pass
+        # normalize multi child ids (ordered de-dupe, unknown ids ignored)
+        children = self._children_by_id
+        ids = dict.fromkeys(cid for cid in (repeat_child_ids or ()) if cid in children)
 
-        # keep legacy single field for backward compat
-        if repeat_child_id:
-            try:
-                self._get_child(repeat_child_id)
-                if repeat_child_id not in ids:
-                    ids.append(repeat_child_id)
-                t.repeat_child_id = repeat_child_id
-            except Exception:
-                # clear legacy if invalid
-                t.repeat_child_id = None
+        # keep legacy single field for backward compat; cleared if missing or invalid
+        if repeat_child_id in children:
+            ids[repeat_child_id] = None
+            t.repeat_child_id = repeat_child_id
         else:
             t.repeat_child_id = None
 
-        t.repeat_child_ids = ids
+        t.repeat_child_ids = list(ids)
 
         # Enforce mutual exclusion: weekly/monthly templates cannot carry unfinished.
         try:
@@ -929,15 +1148,17 @@ class KidsChoresStore:
 
         # If this is a template and early-bonus repeat is active, ensure instances exist.
         try:
-            await self._maybe_spawn_repeat_bonus_instances(t)
+            self._maybe_spawn_repeat_bonus_instances(t)
         except Exception:
             pass
-        await self.async_save()
+        self._mark_dirty("tasks")
 
     async def set_task_icon(self, task_id: str, icon: Optional[str] = None):
         t = self._get_task(task_id)
-        t.icon = (icon or "").strip()
-        await self.async_save()
+        new_icon = (icon or "").strip()
+        if t.icon != new_icon:
+            t.icon = new_icon
+            self._mark_dirty("tasks")
 
     async def update_task(
         self,
@@ -961,6 +1182,9 @@ class KidsChoresStore:
         Note: Repeat settings are managed via set_task_repeat.
         """
         t = self._get_task(task_id)
+        # Snapshot to detect no-op edits (e.g. a form re-submitted unchanged) and skip the write.
+        before = t.to_dict()
+        n_tasks = len(self.tasks)
         is_template = False
         try:
             is_template = (t.assigned_to is None) or (str(t.assigned_to).strip() == "")
@@ -1000,15 +1224,12 @@ class KidsChoresStore:
             t.skip_approval = bool(skip_approval)
         if categories is not None:
             # set categories to validated list
-            new_ids: list[str] = []
             try:
-                for cid in (categories or []):
-                    if any(c.id == cid for c in self.categories):
-                        if cid not in new_ids:
-                            new_ids.append(cid)
+                valid = self._categories_by_id
+                new_ids = [cid for cid in dict.fromkeys(categories or []) if cid in valid]
             except Exception:
                 new_ids = []
-            t.categories = new_ids
+            self._set_task_categories(t, new_ids)
 
         if fastest_wins is not None:
             t.fastest_wins = bool(fastest_wins)
@@ -1016,38 +1237,42 @@ class KidsChoresStore:
         # Keep already spawned repeat instances in sync with the template.
         # This addresses the UX expectation that editing a task under "Tasks" updates the
         # already assigned tasks that were created from it.
+        instances_changed = False
         if is_template:
             try:
-                active_statuses = {STATUS_ASSIGNED, STATUS_IN_PROGRESS, STATUS_AWAITING, STATUS_REJECTED}
-                for inst in self.tasks:
+                for inst in self._instances_by_template.get(t.id, {}).values():
                     if not getattr(inst, "assigned_to", None):
                         continue
-                    if getattr(inst, "repeat_template_id", None) != t.id:
-                        continue
-                    if getattr(inst, "status", None) not in active_statuses:
+                    if getattr(inst, "status", None) not in _SYNCED_STATUSES:
                         # Keep approved history immutable
                         continue
 
+                    inst_before = inst.to_dict()
                     inst.title = t.title
                     inst.points = int(t.points)
                     inst.description = getattr(t, "description", "") or ""
                     inst.icon = getattr(t, "icon", "") or ""
-                    inst.categories = list(getattr(t, "categories", []) or [])
+                    self._set_task_categories(inst, list(getattr(t, "categories", []) or []))
                     inst.early_bonus_enabled = bool(getattr(t, "early_bonus_enabled", False))
                     inst.early_bonus_days = int(getattr(t, "early_bonus_days", 0) or 0)
                     inst.early_bonus_points = int(getattr(t, "early_bonus_points", 0) or 0)
                     inst.persist_until_completed = bool(getattr(t, "persist_until_completed", False))
                     inst.quick_complete = bool(getattr(t, "quick_complete", False))
                     inst.skip_approval = bool(getattr(t, "skip_approval", False))
+                    if inst.to_dict() != inst_before:
+                        instances_changed = True
             except Exception:
                 pass
 
         # If this is a template and early-bonus repeat is active, ensure instances exist.
         try:
-            await self._maybe_spawn_repeat_bonus_instances(t)
+            self._maybe_spawn_repeat_bonus_instances(t)
         except Exception:
             pass
-        await self.async_save()
+        # Instances can drift from an unchanged template (e.g. edited before syncing
+        # existed), so their changes count too.
+        if instances_changed or len(self.tasks) != n_tasks or t.to_dict() != before:
+            self._mark_dirty("tasks")
 
     async def daily_rollover(self):
         """Midnight housekeeping: start fresh each day.
@@ -1056,191 +1281,155 @@ class KidsChoresStore:
         - Then create today's repeated tasks based on the repeat templates captured
           from the existing tasks before cleanup.
         """
-        from homeassistant.util import dt as dt_util
-        from datetime import datetime
+
+        # Due dates are memoized per base day; drop yesterday's entries.
+        _next_repeat_due_cached.cache_clear()
 
         now = dt_util.now()  # aware, local
         today = now.date()
+        # Created stamp shared by every task carried over/spawned below; its local
+        # date is `today`, so the parsed-date cache is seeded alongside it.
+        now_iso = now.astimezone(_UTC).isoformat()
+        created_cache = (now_iso, today)
         weekday = now.weekday()  # 0=Mon..6=Sun
 
-        # Capture scheduled templates BEFORE cleanup so we don't lose the plan
-        templates = []
-        for t in self.tasks:
-            try:
-                mode = str(getattr(t, "schedule_mode", "") or "").strip().lower()
-            except Exception:
-                mode = ""
-            # Backwards compat: if no mode but repeat_days exists, treat as repeat.
-            is_scheduled = bool(getattr(t, "repeat_days", None)) or (mode in ("weekly", "monthly", "repeat"))
-            if not is_scheduled:
-                continue
-
-            # targets can be multiple children
-            targets = list(getattr(t, "repeat_child_ids", []) or [])
-            if not targets and getattr(t, "repeat_child_id", None):
-                targets = [t.repeat_child_id]
-            templates.append({
-                "id": t.id,
-                "title": t.title,
-                "points": t.points,
-                "description": t.description,
-                "repeat_days": list(getattr(t, "repeat_days", []) or []),
-                "schedule_mode": mode,
-                "icon": t.icon,
-                "due": getattr(t, "due", None),
-                "early_bonus_enabled": getattr(t, "early_bonus_enabled", False),
-                "early_bonus_days": getattr(t, "early_bonus_days", 0),
-                "early_bonus_points": getattr(t, "early_bonus_points", 0),
-                "persist_until_completed": getattr(t, "persist_until_completed", False),
-                "quick_complete": getattr(t, "quick_complete", False),
-                "skip_approval": getattr(t, "skip_approval", False),
-                "categories": list(getattr(t, "categories", []) or []),
-                "targets": [x for x in targets if x],
-            })
-
-        def _local_created_date(task: Task):
-            created_raw = getattr(task, "created", None)
-            if not created_raw:
-                return None
-            try:
-                created_dt = dt_util.parse_datetime(str(created_raw))
-                if created_dt is None:
-                    created_dt = datetime.fromisoformat(str(created_raw))
-                return dt_util.as_local(created_dt).date()
-            except Exception:
-                return None
-
-        # 1) Roll/clean older tasks with rules:
+        # Single pass over the tasks: capture the repeat plan (before anything is
+        # dropped, so we don't lose it) and roll/clean older tasks at the same time.
+        # Plan entries are (template task, mode, repeat days, targets) tuples; the
+        # template objects are only read, so no per-template snapshot is needed.
+        # Templates are partitioned by schedule so the spawn step only walks the
+        # bucket(s) that apply to today instead of re-dispatching on mode per template.
+        #
+        # Cleanup rules:
         #    - NEVER remove unassigned template tasks (assigned_to is empty)
         #    - Only carry tasks forward when persist_until_completed is true and task is not approved.
+        plan_by_weekday: list[list[tuple]] = [[] for _ in range(7)]
+        plan_weekly: list[tuple] = []
+        plan_monthly: list[tuple] = []
+        plan_bonus: list[tuple] = []
         kept: list[Task] = []
+        kept_append = kept.append
+        # (child id, title) of assigned tasks dated today, for the title-based de-dupe below
+        existing_today: set[tuple[str, str]] = set()
+        # (template id, child id) of open repeat instances, so spawning needs no task scans
+        active_instances: set[tuple[str, str]] = set()
         for t in self.tasks:
-            is_template = not (getattr(t, "assigned_to", None) and str(getattr(t, "assigned_to", "")).strip())
-            if is_template:
-                kept.append(t)
-                continue
-
-            created_date = _local_created_date(t)
-            # If created is missing/invalid, treat it as "old" so it doesn't stick around forever.
-            is_older = (created_date is None) or (created_date < today)
-            if is_older:
-                if bool(getattr(t, "persist_until_completed", False)) and getattr(t, "status", None) != STATUS_APPROVED:
-                    from datetime import datetime as _dt, timezone as _tz
-                    t.created = _dt.now(_tz.utc).isoformat()
-                    t.carried_over = True
-                    kept.append(t)
-                else:
-                    continue
-            else:
-                kept.append(t)
-        self.tasks = kept
-
-        # 2) Auto-create today's repeated tasks from captured templates
-        # Prefer using repeat_template_id to detect existing active instances (more robust than title/date).
-        def _active_instance_exists(template_id: str, child_id: str) -> bool:
-            try:
-                if template_id and self._active_repeat_instance_exists(template_id, child_id):
-                    return True
-            except Exception:
-                pass
-            return False
-
-        for tpl in templates:
-            rdays = tpl.get("repeat_days") or []
             try:
-                mode = str(tpl.get("schedule_mode") or "").strip().lower()
+                mode = str(getattr(t, "schedule_mode", "") or "").strip().lower()
             except Exception:
                 mode = ""
-
+            rdays = t.repeat_days or []
             # Backwards compat: if no mode but repeat_days exists, treat as repeat.
             if mode in ("", "repeat"):
-                if not rdays:
-                    continue
+                scheduled = bool(rdays)
             elif mode == "weekly":
-                rdays = [0]
+                rdays, scheduled = [0], True
             elif mode == "monthly":
-                rdays = []
+                rdays, scheduled = [], True
             else:
                 # unknown -> ignore
-                continue
-            targets = tpl.get("targets") or []
-
-            is_bonus_repeat = bool(tpl.get("early_bonus_enabled")) and int(tpl.get("early_bonus_days", 0) or 0) > 0 and int(tpl.get("early_bonus_points", 0) or 0) > 0
-            if is_bonus_repeat:
-                # Ignore any fixed date in tpl['due']; deadline is derived from schedule.
-                tpl_id = str(tpl.get("id") or "")
-                if mode == "monthly":
-                    due_iso = self._next_monthly_due_iso(today, include_today=True)
+                scheduled = False
+            if scheduled:
+                # targets can be multiple children
+                targets = [x for x in (t.repeat_child_ids or ()) if x]
+                if not targets and t.repeat_child_id:
+                    targets = [t.repeat_child_id]
+                tpl = (t, mode, rdays, targets)
+                if self._repeat_bonus_active(t):
+                    plan_bonus.append(tpl)
+                elif mode == "weekly":
+                    plan_weekly.append(tpl)
+                elif mode == "monthly":
+                    plan_monthly.append(tpl)
                 else:
-                    due_iso = self._next_repeat_due_iso(today, list(rdays), include_today=True)
-                if tpl_id and due_iso:
-                    for target in targets:
-                        if not target:
-                            continue
-                        if self._active_repeat_instance_exists(tpl_id, target):
-                            continue
-                        await self.add_task(
-                            title=tpl["title"],
-                            points=tpl["points"],
-                            description=tpl["description"],
-                            assigned_to=target,
-                            icon=tpl.get("icon") or "",
-                            due=due_iso,
-                            repeat_template_id=tpl_id,
-                            early_bonus_enabled=True,
-                            early_bonus_days=int(tpl.get("early_bonus_days", 0) or 0),
-                            early_bonus_points=int(tpl.get("early_bonus_points", 0) or 0),
-                            persist_until_completed=True,
-                            quick_complete=tpl.get("quick_complete", False),
-                            skip_approval=tpl.get("skip_approval", False),
-                            categories=list(tpl.get("categories") or [])
-                        )
-                continue
+                    for d in set(rdays):
+                        if d in range(7):
+                            plan_by_weekday[int(d)].append(tpl)
 
-            # Scheduled behavior: create on the scheduled boundary.
-            should_spawn = False
-            if mode in ("", "repeat"):
-                should_spawn = weekday in (rdays or [])
-            elif mode == "weekly":
-                should_spawn = weekday == 0
-            elif mode == "monthly":
-                should_spawn = int(today.day) == 1
-
-            if should_spawn:
-                tpl_id = str(tpl.get("id") or "")
-                for target in targets:
-                    if not target:
-                        continue
-                    if _active_instance_exists(tpl_id, target):
-                        continue
-                    # Fallback de-dupe (in case older data didn't set repeat_template_id)
-                    try:
-                        if any(
-                            (x.assigned_to == target and x.title == tpl.get("title") and _local_created_date(x) == today)
-                            for x in self.tasks
-                        ):
-                            continue
-                    except Exception:
-                        pass
+            is_template = not (t.assigned_to and str(t.assigned_to).strip())
+            if is_template:
+                kept_append(t)
+                continue
 
-                    await self.add_task(
-                        title=tpl["title"],
-                        points=tpl["points"],
-                        description=tpl["description"],
-                        assigned_to=target,
-                        icon=tpl.get("icon") or "",
-                        due=tpl.get("due"),
-                        repeat_template_id=tpl_id or None,
-                        early_bonus_enabled=tpl.get("early_bonus_enabled"),
-                        early_bonus_days=tpl.get("early_bonus_days"),
-                        early_bonus_points=tpl.get("early_bonus_points"),
-                        persist_until_completed=(tpl.get("persist_until_completed", False) if mode in ("", "repeat") else False),
-                        quick_complete=tpl.get("quick_complete", False),
-                        skip_approval=tpl.get("skip_approval", False),
-                        categories=list(tpl.get("categories") or [])
-                    )
+            created_date = _task_local_date(t)
+            # If created is missing/invalid, treat it as "old" so it doesn't stick around forever.
+            if created_date is None or created_date < today:
+                if not (t.persist_until_completed and t.status != STATUS_APPROVED):
+                    continue
+                t.created = now_iso
+                t._created_cache = created_cache
+                t.carried_over = True
+                existing_today.add((t.assigned_to, t.title))
+            elif created_date == today:
+                existing_today.add((t.assigned_to, t.title))
+            kept_append(t)
+            if t.repeat_template_id and t.status in _OPEN_STATUSES:
+                active_instances.add((t.repeat_template_id, t.assigned_to))
+        self.tasks[:] = kept
+        self._rebuild_task_indexes()
+
+        # 2) Auto-create today's repeated tasks from the captured plan.
+        # Instances are built here directly (template values are already normalized),
+        # and the whole rollover is written once at the end.
+        categories_by_id = self._categories_by_id
+
+        def _spawn(tpl: Task, child_id: str, due: Optional[str], bonus: bool, persist: bool) -> None:
+            inst = Task(
+                id=str(uuid4()),
+                title=tpl.title.strip(),
+                points=int(tpl.points),
+                assigned_to=child_id,
+                status=STATUS_ASSIGNED,
+                description=(tpl.description or "").strip(),
+                created=now_iso,
+                due=due,
+                icon=(tpl.icon or "").strip(),
+                repeat_template_id=tpl.id or None,
+                persist_until_completed=persist,
+                quick_complete=bool(tpl.quick_complete),
+                skip_approval=bool(tpl.skip_approval),
+                categories=[cid for cid in (tpl.categories or ()) if cid in categories_by_id],
+                early_bonus_enabled=bool(bonus or tpl.early_bonus_enabled),
+                early_bonus_days=max(0, int(tpl.early_bonus_days or 0)),
+                early_bonus_points=max(0, int(tpl.early_bonus_points or 0)),
+            )
+            inst._created_cache = created_cache
+            self._append_task(inst)
+            existing_today.add((child_id, inst.title))
+            if inst.repeat_template_id:
+                active_instances.add((inst.repeat_template_id, child_id))
+
+        children = self._children_by_id
+        for tpl, mode, rdays, targets in plan_bonus:
+            # Ignore any fixed date on the template; deadline is derived from schedule.
+            if mode == "monthly":
+                due_iso = self._next_monthly_due_iso(today, include_today=True)
+            else:
+                due_iso = self._next_repeat_due_iso(today, rdays, include_today=True)
+            if not (tpl.id and due_iso):
+                continue
+            for target in targets:
+                if target not in children or (tpl.id, target) in active_instances:
+                    continue
+                _spawn(tpl, target, due_iso, True, True)
+
+        # Scheduled behavior: create on the scheduled boundary.
+        to_spawn = plan_by_weekday[weekday]
+        if weekday == 0:
+            to_spawn = to_spawn + plan_weekly
+        if today.day == 1:
+            to_spawn = to_spawn + plan_monthly
+        for tpl, mode, rdays, targets in to_spawn:
+            persist = bool(tpl.persist_until_completed) if mode in ("", "repeat") else False
+            for target in targets:
+                if target not in children or (tpl.id, target) in active_instances:
+                    continue
+                # Fallback de-dupe (in case older data didn't set repeat_template_id)
+                if (target, tpl.title) in existing_today:
+                    continue
+                _spawn(tpl, target, tpl.due, False, persist)
 
-        await self.async_save()
+        self._mark_dirty("tasks")
 
     async def reset_points(self, child_id: Optional[str] = None):
         if child_id:
@@ -1249,12 +1438,12 @@ class KidsChoresStore:
         else:
             for c in self.children:
                 c.points = 0
-        await self.async_save()
+        self._mark_dirty("children")
 
     async def add_points(self, child_id: str, points: int):
         c = self._get_child(child_id)
         c.points += int(points)
-        await self.async_save()
+        self._mark_dirty("children")
 
     # --- Shop API ---
     async def add_shop_item(self, title: str, price: int, icon: Optional[str] = None, image: Optional[str] = None, active: bool = True, actions: Optional[List[Dict[str, Any]]] = None):
@@ -1265,7 +1454,9 @@ class KidsChoresStore:
         except Exception:
             it.actions = []
         self.items.append(it)
-        await self.async_save()
+        self._items_by_id[sid] = it
+        self._ref_image(it.image, 1)
+        self._mark_dirty("items")
         return it
 
     async def update_shop_item(self, item_id: str, title: Optional[str] = None, price: Optional[int] = None, icon: Optional[str] = None, image: Optional[str] = None, active: Optional[bool] = None, actions: Optional[List[Dict[str, Any]]] = None):
@@ -1277,7 +1468,9 @@ class KidsChoresStore:
         if icon is not None:
             it.icon = str(icon).strip()
         if image is not None:
+            self._ref_image(it.image, -1)
             it.image = str(image).strip()
+            self._ref_image(it.image, 1)
         if active is not None:
             it.active = bool(active)
         if actions is not None:
@@ -1285,7 +1478,8 @@ class KidsChoresStore:
                 it.actions = self._normalize_actions(actions)
             except Exception:
                 it.actions = []
-        await self.async_save()
+            self._compiled_actions.pop(it.id, None)
+        self._mark_dirty("items")
         return it
 
     async def delete_shop_item(self, item_id: str):
@@ -1296,28 +1490,51 @@ class KidsChoresStore:
             it = None
         img = (getattr(it, "image", "") or "").strip() if it else ""
 
-        self.items = [i for i in self.items if i.id != item_id]
-        await self.async_save()
+        if it is not None:
+            _remove_identity(self.items, it)
+            del self._items_by_id[item_id]
+            self._ref_image(img, -1)
+        self._compiled_actions.pop(item_id, None)
+        self._mark_dirty("items")
+
+        # Best-effort cleanup of orphaned images stored under /local/chores4kids/.
+        # Candidates are collected and swept together shortly after, so deleting
+        # several items costs one usage check and one executor job.
+        if img.startswith("/local/"):
+            self._orphan_images.add(img)
+            if self._orphan_sweep_unsub is None:
+                self._orphan_sweep_unsub = async_call_later(
+                    self.hass, IMAGE_SWEEP_DELAY, self._async_sweep_orphan_images
+                )
 
-        # Best-effort cleanup of orphaned images stored under /local/chores4kids/
+    async def _async_sweep_orphan_images(self, _now=None) -> None:
+        """Unlink images of deleted shop items that nothing references anymore."""
+        self._orphan_sweep_unsub = None
+        candidates, self._orphan_images = self._orphan_images, set()
         try:
-            if img and img.startswith("/local/"):
-                # only delete if not used by another item or in purchases history
-                used_by_item = any((getattr(x, "image", "") or "").strip() == img for x in self.items)
-                used_by_purchase = any((getattr(p, "image", "") or "").strip() == img for p in self.purchases)
-                if not used_by_item and not used_by_purchase:
-                    rel = img[len("/local/"):].lstrip("/")  # e.g. chores4kids/xyz.jpg
-                    abs_path = self.hass.config.path("www", *rel.split("/"))
-                    def _rm():
-                        if os.path.exists(abs_path):
-                            try:
-                                os.remove(abs_path)
-                            except Exception:
-                                pass
-                    await self.hass.async_add_executor_job(_rm)
+            # only delete if not used by an item or in purchases history (checked
+            # now, as an item may have been re-added with the same image meanwhile)
+            refs = self._image_refs
+            orphans = [img for img in candidates if not refs.get(img)]
+            if not orphans:
+                return
+            config_path = self.hass.config.path
+
+            def _rm_all():
+                for img in orphans:
+                    # e.g. /local/chores4kids/xyz.jpg -> <config>/www/chores4kids/xyz.jpg
+                    abs_path = config_path("www", *img[len("/local/"):].lstrip("/").split("/"))
+                    try:
+                        os.unlink(abs_path)
+                    except FileNotFoundError:
+                        pass
+                    except OSError:
+                        _LOGGER.debug("image cleanup failed: %s", abs_path)
+
+            await self.hass.async_add_executor_job(_rm_all)
         except Exception:
-            # Never fail deletion because of cleanup
-            pass
+            # Never fail because of cleanup
+            _LOGGER.debug("image cleanup sweep failed", exc_info=True)
 
     async def buy_shop_item(self, child_id: str, item_id: str):
         child = self._get_child(child_id)
@@ -1326,64 +1543,170 @@ class KidsChoresStore:
         if child.points < price:
             raise ValueError("insufficient_points")
         child.points -= price
-        from datetime import datetime, timezone
         pur = Purchase(
             id=str(uuid4()), child_id=child.id, item_id=it.id,
             title=it.title, price=price, icon=it.icon, image=getattr(it, 'image', ''),
-            ts=datetime.now(timezone.utc).isoformat(), child_name=child.name
+            ts=_now_iso(), child_name=child.name
         )
-        self.purchases.append(pur)
-        await self.async_save()
+        self._append_purchase(pur)
+        self._mark_dirty("children")
         # Execute any configured actions asynchronously (non-blocking)
         try:
-            actions = getattr(it, "actions", []) or []
-            if actions:
-                self.hass.async_create_task(self._run_actions(list(actions)))
+            steps = self._item_steps(it)
+            if steps:
+                self.fire_actions(steps)
         except Exception:
             pass
         return pur
 
+    def _append_purchase(self, pur: "Purchase") -> None:
+        """Record a purchase and extend the serialized purchases list in place.
+
+        Purchase history only grows between clears, so a new purchase is appended
+        to the cached payload list instead of re-serializing the whole history.
+        """
+        self.purchases.append(pur)
+        self._ref_image(pur.image, 1)
+        cached = self._payload_parts.get("purchases")
+        if cached is not None and "purchases" not in self._dirty_parts:
+            cached.append(pur.to_dict())
+        else:
+            self._dirty_parts.add("purchases")
+
     async def clear_shop_history(self, child_id: Optional[str] = None):
         """Clear purchase history. If child_id is provided, clear only entries for that child."""
         if child_id:
             # Validate child exists; raises if missing
             self._get_child(child_id)
-            self.purchases = [p for p in self.purchases if p.child_id != child_id]
+            self.purchases[:] = [p for p in self.purchases if p.child_id != child_id]
         else:
-            self.purchases = []
-        await self.async_save()
+            self.purchases.clear()
+        self._rebuild_image_refs()
+        self._mark_dirty("purchases")
 
     # Helpers
+    def _ref_image(self, img: Optional[str], delta: int) -> None:
+        """Adjust the reference count of an image URL (blank URLs are not tracked)."""
+        key = (img or "").strip()
+        if not key:
+            return
+        n = self._image_refs[key] + delta
+        if n > 0:
+            self._image_refs[key] = n
+        else:
+            self._image_refs.pop(key, None)
+
+    def _rebuild_image_refs(self) -> None:
+        refs: Counter[str] = Counter((x.image or "").strip() for x in self.items)
+        refs.update((p.image or "").strip() for p in self.purchases)
+        refs.pop("", None)
+        self._image_refs = refs
+
+    def _index_task(self, t: Task) -> None:
+        """Register ``t`` in the secondary task indexes."""
+        self._tasks_by_id[t.id] = t
+        if not t.assigned_to:
+            self._templates_by_id[t.id] = t
+        else:
+            self._tasks_by_child.setdefault(t.assigned_to, {})[t.id] = t
+        for cid in t.categories or ():
+            self._tasks_by_category.setdefault(cid, {})[t.id] = t
+        if t.repeat_template_id:
+            self._instances_by_template.setdefault(t.repeat_template_id, {})[t.id] = t
+
+    def _unindex_task(self, t: Task) -> None:
+        self._tasks_by_id.pop(t.id, None)
+        self._templates_by_id.pop(t.id, None)
+        if t.assigned_to:
+            bucket = self._tasks_by_child.get(t.assigned_to)
+            if bucket:
+                bucket.pop(t.id, None)
+        if t.repeat_template_id:
+            bucket = self._instances_by_template.get(t.repeat_template_id)
+            if bucket:
+                bucket.pop(t.id, None)
+        for cid in t.categories or ():
+            bucket = self._tasks_by_category.get(cid)
+            if bucket:
+                bucket.pop(t.id, None)
+
+    def _rebuild_task_indexes(self) -> None:
+        self._tasks_by_id = {}
+        self._templates_by_id = {}
+        self._tasks_by_category = {}
+        self._instances_by_template = {}
+        self._tasks_by_child = {}
+        for t in self.tasks:
+            self._index_task(t)
+
+    def _append_task(self, t: Task) -> None:
+        self.tasks.append(t)
+        self._index_task(t)
+
+    def _set_task_categories(self, t: Task, cat_ids: list[str]) -> None:
+        for cid in t.categories or ():
+            bucket = self._tasks_by_category.get(cid)
+            if bucket:
+                bucket.pop(t.id, None)
+        t.categories = cat_ids
+        for cid in cat_ids:
+            self._tasks_by_category.setdefault(cid, {})[t.id] = t
+
+    def _set_task_assignee(self, t: Task, child_id: Optional[str]) -> None:
+        """Change ``t.assigned_to``, moving it between the per-child and template indexes."""
+        if t.assigned_to:
+            bucket = self._tasks_by_child.get(t.assigned_to)
+            if bucket:
+                bucket.pop(t.id, None)
+        else:
+            self._templates_by_id.pop(t.id, None)
+        t.assigned_to = child_id
+        if child_id:
+            # Rebuilt rather than appended to, so the bucket keeps the tasks' order
+            # in self.tasks (what tasks_for_child returns); reassignment is rare.
+            self._tasks_by_child[child_id] = {
+                x.id: x for x in self.tasks if x.assigned_to == child_id
+            }
+        else:
+            self._templates_by_id[t.id] = t
+
+    def tasks_for_child(self, child_id: str) -> List[Task]:
+        """Tasks currently assigned to ``child_id``, in the order of ``self.tasks``."""
+        return list(self._tasks_by_child.get(child_id, {}).values())
+
     def _get_child(self, child_id: str) -> Child:
-        for c in self.children:
-            if c.id == child_id:
-                return c
-        raise ValueError("child_not_found")
+        try:
+            return self._children_by_id[child_id]
+        except KeyError:
+            raise ValueError("child_not_found") from None
 
     def _get_task(self, task_id: str) -> Task:
-        for t in self.tasks:
-            if t.id == task_id:
-                return t
-        raise ValueError("task_not_found")
+        try:
+            return self._tasks_by_id[task_id]
+        except KeyError:
+            raise ValueError("task_not_found") from None
 
     def _get_category(self, category_id: str) -> Category:
-        for cat in self.categories:
-            if cat.id == category_id:
-                return cat
-        raise ValueError("category_not_found")
+        try:
+            return self._categories_by_id[category_id]
+        except KeyError:
+            raise ValueError("category_not_found") from None
 
     # --- Categories ---
     async def add_category(self, name: str, color: str = "") -> Category:
         cid = str(uuid4())
         cat = Category(id=cid, name=str(name).strip(), color=self._normalize_hex_color(color))
         self.categories.append(cat)
-        await self.async_save()
+        self._categories_by_id[cid] = cat
+        self._mark_dirty("categories")
         return cat
 
     async def rename_category(self, category_id: str, new_name: str) -> Category:
         cat = self._get_category(category_id)
-        cat.name = str(new_name).strip()
-        await self.async_save()
+        name = str(new_name).strip()
+        if cat.name != name:
+            cat.name = name
+            self._mark_dirty("categories")
         return cat
 
     def _normalize_hex_color(self, value: str) -> str:
@@ -1392,38 +1715,44 @@ class KidsChoresStore:
             return ""
         if not v.startswith("#"):
             v = "#" + v
+        n = len(v)
         # Expand shorthand #rgb -> #rrggbb
-        m3 = re.fullmatch(r"#([0-9a-f]{3})", v)
-        if m3:
-            r, g, b = m3.group(1)
-            return f"#{r}{r}{g}{g}{b}{b}"
-        if re.fullmatch(r"#[0-9a-f]{6}", v):
-            return v
+        if n == 4:
+            r, g, b = v[1], v[2], v[3]
+            if r in _HEX and g in _HEX and b in _HEX:
+                return f"#{r}{r}{g}{g}{b}{b}"
+        elif n == 7:
+            if all(c in _HEX for c in v[1:]):
+                return v
         raise ValueError("invalid_color")
 
     async def set_category_color(self, category_id: str, color: str) -> Category:
         cat = self._get_category(category_id)
-        cat.color = self._normalize_hex_color(color)
-        await self.async_save()
+        new_color = self._normalize_hex_color(color)
+        if cat.color != new_color:
+            cat.color = new_color
+            self._mark_dirty("categories")
         return cat
 
     async def delete_category(self, category_id: str):
+        cat = self._categories_by_id.pop(category_id, None)
+        if cat is None:
+            # Unknown id: nothing to remove, skip the write
+            return
         # remove from tasks and from list
-        self.categories = [c for c in self.categories if c.id != category_id]
-        for t in self.tasks:
-            try:
-                if getattr(t, "categories", None):
-                    t.categories = [cid for cid in t.categories if cid != category_id]
-            except Exception:
-                pass
-        await self.async_save()
+        _remove_identity(self.categories, cat)
+        for t in self._tasks_by_category.pop(category_id, {}).values():
+            cats = t.categories
+            if cats and category_id in cats:
+                t.categories = [cid for cid in cats if cid != category_id]
+        self._mark_dirty("categories", "tasks")
 
     # shop helpers
     def _get_item(self, item_id: str):
-        for i in self.items:
-            if i.id == item_id:
-                return i
-        raise ValueError("item_not_found")
+        try:
+            return self._items_by_id[item_id]
+        except KeyError:
+            raise ValueError("item_not_found") from None
 
     # ---- Shop action engine ----
     def _normalize_actions(self, actions: Optional[List[Dict[str, Any]]]):
@@ -1438,54 +1767,112 @@ class KidsChoresStore:
         if not actions:
             return out
         for step in actions:
-            try:
-                t = str(step.get("type") or step.get("kind") or "").lower()
-                if t == "delay":
+            if not isinstance(step, dict):
+                continue
+            t = _first_str(step, "type", "kind").lower()
+            if t == "delay":
+                try:
                     sec = int(step.get("seconds") or step.get("secs") or 0)
-                    if sec > 0:
-                        out.append({"type": "delay", "seconds": sec})
+                except (TypeError, ValueError):
                     continue
-                if t in ("entity_service", "service", "call_service"):
-                    ent = str(step.get("entity_id") or "").strip()
-                    if not ent:
-                        continue
-                    dom = ent.split(".", 1)[0]
-                    op = str(step.get("op") or step.get("service") or "turn_on").strip()
-                    data = step.get("data") or {}
-                    out.append({
-                        "type": "service",
-                        "domain": step.get("domain") or dom,
-                        "service": op,
-                        "entity_id": ent,
-                        "data": data,
-                    })
-            except Exception:
-                continue
+                if sec > 0:
+                    out.append({"type": "delay", "seconds": sec})
+            elif t in _SERVICE_TYPES:
+                ent = _first_str(step, "entity_id")
+                if not ent:
+                    continue
+                dom = ent.partition(".")[0]
+                op = _first_str(step, "op", "service") or "turn_on"
+                data = step.get("data") or {}
+                out.append({
+                    "type": "service",
+                    "domain": step.get("domain") or dom,
+                    "service": op,
+                    "entity_id": ent,
+                    "data": data,
+                })
         return out
 
-    async def _run_actions(self, actions: List[Dict[str, Any]]):
+    def _compile_actions(self, actions: List[Dict[str, Any]]) -> List[Union[DelayStep, ServiceStep]]:
+        """Turn normalized (stored) action dicts into compact step records for execution.
+
+        All validation happens here, once per item: malformed steps (e.g. from a
+        hand-edited storage file) are dropped, so running the steps needs no checks.
+        """
+        steps: List[Union[DelayStep, ServiceStep]] = []
         for step in actions:
-            try:
-                if step.get("type") == "delay":
-                    sec = int(step.get("seconds") or 0)
-                    if sec > 0:
-                        await asyncio.sleep(sec)
-                elif step.get("type") == "service":
-                    domain = step.get("domain")
-                    service = step.get("service")
-                    data = dict(step.get("data") or {})
-                    ent = step.get("entity_id")
-                    if ent:
-                        data.setdefault("entity_id", ent)
-                    if domain and service:
-                        await self.hass.services.async_call(domain, service, data, blocking=False)
-            except Exception:
-                # Keep processing remaining steps
+            if not isinstance(step, dict):
                 continue
+            typ = step.get("type")
+            if typ == "delay":
+                try:
+                    sec = int(step.get("seconds") or 0)
+                except (TypeError, ValueError):
+                    continue
+                if sec > 0:
+                    steps.append(DelayStep(sec))
+            elif typ == "service":
+                domain = step.get("domain")
+                service = step.get("service")
+                data = step.get("data") or {}
+                if domain and service and isinstance(data, dict):
+                    # Resolve the call payload once here instead of copying it per run;
+                    # only steps that still need entity_id merged get their own dict.
+                    ent = step.get("entity_id") or ""
+                    if ent and "entity_id" not in data:
+                        data = {**data, "entity_id": ent}
+                    steps.append(ServiceStep(sys.intern(str(domain)), sys.intern(str(service)), ent, data))
+        return steps
+
+    def _item_steps(self, it: "ShopItem") -> List[Union[DelayStep, ServiceStep]]:
+        """Return the compiled action steps for ``it``, compiling them on first use."""
+        steps = self._compiled_actions.get(it.id)
+        if steps is None:
+            steps = self._compiled_actions[it.id] = self._compile_actions(it.actions or [])
+        return steps
+
+    def fire_actions(self, steps: List[Union[DelayStep, ServiceStep]]) -> None:
+        """Run action steps in the background so delays never hold up the caller."""
+        self.hass.async_create_task(self._run_actions(steps))
+
+    async def _run_actions(self, steps: List[Union[DelayStep, ServiceStep]]):
+        # Service calls between two delays are independent, so dispatch each such
+        # segment concurrently and only serialize on the delay steps themselves.
+        # Failures are contained per call in _call_action_service.
+        segment: list = []
+        for step in steps:
+            if isinstance(step, DelayStep):
+                if segment:
+                    await asyncio.gather(*segment)
+                    segment = []
+                await asyncio.sleep(step.seconds)
+            else:
+                segment.append(self._call_action_service(step.domain, step.service, step.data))
+        if segment:
+            await asyncio.gather(*segment)
+
+    async def _call_action_service(self, domain: str, service: str, data: Dict[str, Any]):
+        """Run one action service call; a failing step never stops the others."""
+        if self._action_sem is None:
+            self._action_sem = asyncio.Semaphore(self._ACTION_FANOUT)
+        try:
+            async with self._action_sem:
+                await self.hass.services.async_call(domain, service, data, blocking=False)
+        except Exception:
+            _LOGGER.debug("action step failed: %s.%s", domain, service, exc_info=True)
 
 # ---- Point shop ----
 
-@dataclass
+class DelayStep(NamedTuple):
+    seconds: int
+
+class ServiceStep(NamedTuple):
+    domain: str
+    service: str
+    entity_id: str
+    data: Dict[str, Any]
+
+@dataclass(slots=True)
 class ShopItem:
     id: str
     title: str
@@ -1495,7 +1882,18 @@ class ShopItem:
     active: bool = True
     actions: List[Dict[str, Any]] = field(default_factory=list)
 
-@dataclass
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "title": self.title,
+            "price": self.price,
+            "icon": self.icon,
+            "image": self.image,
+            "active": self.active,
+            "actions": list(self.actions),
+        }
+
+@dataclass(slots=True)
 class Purchase:
     id: str
     child_id: str
@@ -1509,4 +1907,47 @@ class Purchase:
     # Optional denormalized for convenience (filled when saving)
     child_name: str = ""
 
+    # Serialized form, built once: purchases are never edited after creation (not persisted)
+    _dict_cache: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+
+    def to_dict(self) -> Dict[str, Any]:
+        if self._dict_cache is None:
+            self._dict_cache = self._build_dict()
+        return self._dict_cache
+
+    def _build_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "child_id": self.child_id,
+            "item_id": self.item_id,
+            "title": self.title,
+            "price": self.price,
+            "icon": self.icon,
+            "image": self.image,
+            "ts": self.ts,
+            "child_name": self.child_name,
+        }
+
+def _records_from_data(data: Dict[str, Any]) -> tuple:
+    """Build the record lists from stored data (runs in the executor at load)."""
+    children = [Child(**c) for c in data.get("children", [])]
+    categories = [Category(**c) for c in data.get("categories", [])]
+    # Migrate tasks: if early bonus was configured before the explicit toggle existed,
+    # enable it automatically so behavior remains unchanged.
+    tasks: list[Task] = []
+    for t in list(data.get("tasks", []) or []):
+        try:
+            if isinstance(t, dict) and "early_bonus_enabled" not in t:
+                eb_days = int(t.get("early_bonus_days", 0) or 0)
+                eb_points = int(t.get("early_bonus_points", 0) or 0)
+                t["early_bonus_enabled"] = bool(eb_days > 0 and eb_points > 0)
+        except Exception:
+            # Best-effort migration; fall back to dataclass defaults
+            pass
+        tasks.append(Task(**t))
+    # Optional keys for backwards compatibility
+    items = [ShopItem(**i) for i in data.get("items", [])]
+    purchases = [Purchase(**p) for p in data.get("purchases", [])]
+    return children, categories, tasks, items, purchases
+
 # End of storage